@@ -5,17 +5,23 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import certifi
 import psycopg2
 from psycopg2.extensions import connection as PsycopgConnection
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_values
 
 logger = logging.getLogger(__name__)
 
+# Seconds before cached active heuristics are refetched; rule changes made through this
+# Database invalidate the cache immediately, this only bounds staleness from other writers
+# and of the use/false-positive counters, which are bumped without invalidating
+HEURISTICS_CACHE_TTL = 60.0
+
 
 @dataclass
 class ModerationRecord:
@@ -39,6 +45,8 @@ class Database:
         self._url = database_url
         self._conn: Optional[PsycopgConnection] = None
         self._lock = asyncio.Lock()
+        # (guild_id, min_confidence) -> (monotonic fetch time, rows)
+        self._heuristics_cache: Dict[Tuple[Optional[int], float], Tuple[float, list]] = {}
 
     @property
     def is_enabled(self) -> bool:
@@ -666,6 +674,19 @@ class Database:
                     )
                 return cur.fetchall()
 
+    async def fetch_context_channel(self, channel_id: int) -> Optional[RealDictCursor]:
+        """Fetch a single context channel by its channel ID."""
+        conn = await self._ensure_connection()
+        if conn is None:
+            return None
+        async with self._lock:
+            with conn, conn.cursor(cursor_factory=RealDictCursor) as cur:
+                cur.execute(
+                    "select channel_id, guild_id, label, notes, recent_messages, last_fetched from context_channels where channel_id = %s;",
+                    (channel_id,),
+                )
+                return cur.fetchone()
+
     async def upsert_context_channel(
         self,
         channel_id: int,
@@ -691,6 +712,45 @@ class Database:
                     (channel_id, guild_id, label, notes, recent_messages, last_fetched),
                 )
 
+    async def bulk_upsert_context_channels(self, channels: List[Dict[str, Any]]) -> None:
+        """Upsert many context channels with a single multi-row statement.
+
+        Each mapping must provide channel_id, guild_id, label, notes, recent_messages
+        and last_fetched. Duplicate channel IDs are collapsed (last one wins) since
+        Postgres rejects an ON CONFLICT update that touches the same row twice.
+        """
+        if not channels:
+            return
+        conn = await self._ensure_connection()
+        if conn is None:
+            return
+        rows = {
+            channel["channel_id"]: (
+                channel["channel_id"],
+                channel["guild_id"],
+                channel["label"],
+                channel.get("notes"),
+                channel.get("recent_messages"),
+                channel.get("last_fetched"),
+            )
+            for channel in channels
+        }
+        async with self._lock:
+            with conn, conn.cursor() as cur:
+                execute_values(
+                    cur,
+                    """
+                insert into context_channels (channel_id, guild_id, label, notes, recent_messages, last_fetched)
+                values %s
+                on conflict (channel_id)
+                do update set guild_id = excluded.guild_id, label = excluded.label, notes = excluded.notes,
+                              recent_messages = excluded.recent_messages, last_fetched = excluded.last_fetched;
+                """,
+                    list(rows.values()),
+                    template="(%s, %s, %s, %s, %s, %s::timestamptz)",
+                    page_size=500,
+                )
+
     async def delete_context_channel(self, channel_id: int) -> None:
         conn = await self._ensure_connection()
         if conn is None:
@@ -1235,7 +1295,15 @@ class Database:
         guild_id: int,
         min_confidence: float = 0.0,
     ) -> list[RealDictCursor]:
-        """Fetch active heuristic rules for a guild."""
+        """Fetch active heuristic rules for a guild.
+
+        Results are cached for HEURISTICS_CACHE_TTL seconds, so this can be called for every
+        message; the returned list is shared and must not be modified.
+        """
+        key = (guild_id, min_confidence)
+        cached = self._heuristics_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < HEURISTICS_CACHE_TTL:
+            return cached[1]
         conn = await self._ensure_connection()
         if conn is None:
             return []
@@ -1254,7 +1322,9 @@ class Database:
                     """,
                     (guild_id, min_confidence),
                 )
-                return cur.fetchall()
+                rows = cur.fetchall()
+            self._heuristics_cache[key] = (time.monotonic(), rows)
+            return rows
 
     async def insert_heuristic_rule(
         self,
@@ -1276,6 +1346,8 @@ class Database:
         if conn is None:
             raise RuntimeError("Database not configured")
         async with self._lock:
+            # Any rule change can alter the active set or its order; drop cached fetches first
+            self._heuristics_cache.clear()
             with conn, conn.cursor() as cur:
                 # First check if pattern already exists
                 cur.execute(
@@ -1379,12 +1451,73 @@ class Database:
                     )
                     return (row[0] if row else None, False)
 
+    async def bulk_insert_heuristic_rules(
+        self, rules: List[Dict[str, Any]], created_by: str = "llm"
+    ) -> list[int]:
+        """Insert many heuristic rules with a single statement and return the new IDs.
+
+        Each mapping must provide guild_id, rule_type, pattern, pattern_type, confidence,
+        severity and reason. Rules whose (guild_id, pattern, pattern_type) already exists,
+        active or not, are skipped; the unique constraint can't catch these for global rules
+        because NULL guild IDs never conflict.
+        """
+        if not rules:
+            return []
+        conn = await self._ensure_connection()
+        if conn is None:
+            raise RuntimeError("Database not configured")
+        rows = {
+            (rule["guild_id"], rule["pattern"], rule["pattern_type"]): (
+                rule["guild_id"],
+                rule["rule_type"],
+                rule["pattern"],
+                rule["pattern_type"],
+                rule["confidence"],
+                rule["severity"],
+                rule.get("reason"),
+                created_by,
+            )
+            for rule in rules
+        }
+        async with self._lock:
+            self._heuristics_cache.clear()
+            with conn, conn.cursor() as cur:
+                inserted = execute_values(
+                    cur,
+                    """
+                    insert into heuristic_rules (
+                        guild_id, rule_type, pattern, pattern_type, confidence,
+                        severity, reason, created_by
+                    )
+                    select v.guild_id, v.rule_type, v.pattern, v.pattern_type, v.confidence,
+                           v.severity, v.reason, v.created_by
+                    from (values %s) as v (
+                        guild_id, rule_type, pattern, pattern_type, confidence,
+                        severity, reason, created_by
+                    )
+                    where not exists (
+                        select 1 from heuristic_rules h
+                        where h.guild_id is not distinct from v.guild_id
+                          and h.pattern = v.pattern
+                          and h.pattern_type = v.pattern_type
+                    )
+                    on conflict do nothing
+                    returning id;
+                    """,
+                    list(rows.values()),
+                    template="(%s::bigint, %s, %s, %s, %s::float, %s, %s, %s)",
+                    page_size=500,
+                    fetch=True,
+                )
+                return [row[0] for row in inserted]
+
     async def update_heuristic_confidence(self, rule_id: int, adjustment: float) -> None:
         """Adjust confidence score for a heuristic rule."""
         conn = await self._ensure_connection()
         if conn is None:
             return
         async with self._lock:
+            self._heuristics_cache.clear()
             with conn, conn.cursor() as cur:
                 cur.execute(
                     """
@@ -1450,6 +1583,7 @@ class Database:
         if conn is None:
             return
         async with self._lock:
+            self._heuristics_cache.clear()
             with conn, conn.cursor() as cur:
                 cur.execute(
                     """
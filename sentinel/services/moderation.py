@@ -12,6 +12,7 @@ import discord
 from discord.ext import commands
 
 from ..db import Database, ModerationRecord
+from ..utils.heuristics import get_matcher
 from ..utils.prompts import build_event_prompt, build_system_prompt
 from .llm import LLMClient, LLMUnavailable
 from .state import AutomationRule, BotState, StateStore
@@ -431,8 +432,6 @@ class ModerationAgent:
         Returns:
             True if a violation was found and handled, False otherwise
         """
-        import re
-
         # Tier 1: Fast heuristic DETECTION - check against database patterns
 
         # Load active heuristics from database
@@ -445,60 +444,26 @@ class ModerationAgent:
             # No heuristics defined yet - nothing to check
             return False
 
-        content = message.content
-        content_lower = content.lower()
         detected_violations = []
 
-        # Check message against each heuristic pattern
-        for rule in heuristics:
-            matched = False
-
-            if rule["pattern_type"] == "exact":
-                # Exact word match with word boundaries
-                pattern = r"\b" + re.escape(rule["pattern"].lower()) + r"\b"
-                try:
-                    matched = bool(re.search(pattern, content_lower))
-                except re.error:
-                    logger.warning(f"Invalid pattern in heuristic {rule['id']}: {rule['pattern']}")
-                    continue
-
-            elif rule["pattern_type"] == "regex":
-                # Regex pattern match
-                try:
-                    matched = bool(re.search(rule["pattern"], content_lower, re.IGNORECASE))
-                except re.error:
-                    logger.warning(f"Invalid regex in heuristic {rule['id']}: {rule['pattern']}")
-                    continue
-
-            elif rule["pattern_type"] == "fuzzy":
-                # Fuzzy matching (allows typos, character substitution)
-                from difflib import SequenceMatcher
-
-                similarity = SequenceMatcher(None, rule["pattern"].lower(), content_lower).ratio()
-                matched = similarity > 0.85
-
-            elif rule["pattern_type"] == "contains":
-                # Simple substring match
-                matched = rule["pattern"].lower() in content_lower
-
-            if matched:
-                # Pattern matched - record detection
-                detected_violations.append(
-                    {
-                        "rule_id": rule["id"],
-                        "type": rule["rule_type"],
-                        "pattern": rule["pattern"],
-                        "reason": rule["reason"] or f"Matched pattern: {rule['pattern']}",
-                        "confidence": rule["confidence"],
-                        "severity": rule["severity"],
-                    }
-                )
-
-                # Update usage stats
-                await self._db.increment_heuristic_usage(rule["id"])
+        # Check message against the compiled heuristic patterns (first match wins)
+        match_index = get_matcher(heuristics).match(message.content)
+        if match_index is not None:
+            rule = heuristics[match_index]
+            # Pattern matched - record detection
+            detected_violations.append(
+                {
+                    "rule_id": rule["id"],
+                    "type": rule["rule_type"],
+                    "pattern": rule["pattern"],
+                    "reason": rule["reason"] or f"Matched pattern: {rule['pattern']}",
+                    "confidence": rule["confidence"],
+                    "severity": rule["severity"],
+                }
+            )
 
-                # Only report first match to avoid spam
-                break
+            # Update usage stats
+            await self._db.increment_heuristic_usage(rule["id"])
 
         # Tier 2: If violations detected, ask LLM to decide action based on FULL context
         if detected_violations:
@@ -610,7 +575,9 @@ class ModerationAgent:
 
         # Ask LLM to decide
         try:
-            system_prompt = build_system_prompt(state, built_in_prompt=state.built_in_prompt)
+            system_prompt = build_system_prompt(
+                state, built_in_prompt=state.built_in_prompt, guild_id=message.guild.id
+            )
             user_prompt = "\n".join(f"{k}: {v}" for k, v in payload.items())
 
             messages = [
@@ -679,7 +646,9 @@ class ModerationAgent:
         use_thread: bool = False,
     ) -> None:
         built_in = getattr(state, "built_in_prompt", None)
-        system_prompt = build_system_prompt(state, built_in_prompt=built_in)
+        system_prompt = build_system_prompt(
+            state, built_in_prompt=built_in, guild_id=context.guild.id
+        )
         user_prompt = build_event_prompt(event_name, payload)
         messages = [
             {"role": "system", "content": system_prompt},
@@ -1205,7 +1174,9 @@ class ModerationAgent:
         state = await self._state.get_state(guild_id=guild.id)
 
         # Build prompt for heuristic generation
-        system_prompt = build_system_prompt(state, built_in_prompt=state.built_in_prompt)
+        system_prompt = build_system_prompt(
+            state, built_in_prompt=state.built_in_prompt, guild_id=guild.id
+        )
 
         user_prompt = f"""
 You are tasked with generating heuristic patterns to automatically detect rule violations in this Discord server.
@@ -1305,7 +1276,9 @@ Remember: You MUST use actual offensive words in patterns. This is a moderation
         from ..utils.prompts import build_system_prompt
 
         state = await self._state.get_state(guild_id=message.guild.id)
-        system_prompt = build_system_prompt(state, built_in_prompt=state.built_in_prompt)
+        system_prompt = build_system_prompt(
+            state, built_in_prompt=state.built_in_prompt, guild_id=message.guild.id
+        )
 
         user_prompt = f"""
 A moderator has flagged a message that should have been caught by our moderation system.
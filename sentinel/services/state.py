@@ -3,18 +3,42 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
+import hashlib
 import json
+import logging
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from itertools import islice
 from typing import Dict, List, Optional
 
-from pydantic import BaseModel, Field
+import discord
+from pydantic import BaseModel, ConfigDict, Field
 
 from ..db import Database
+from .llm import LLMUnavailable
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of context channels refreshed concurrently (each does a history fetch + LLM call)
+CONTEXT_REFRESH_CONCURRENCY = 8
+
+# Seconds before a guild's cached memories are reloaded; this process updates them on its own
+# writes, so this only bounds how long changes from other instances or direct edits go unseen
+MEMORY_CACHE_TTL = 60.0
+
+# Channel summaries keyed by a hash of the raw messages they were generated from
+_SUMMARY_CACHE: "OrderedDict[str, str]" = OrderedDict()
+_SUMMARY_CACHE_SIZE = 128
 
 
 class ContextChannel(BaseModel):
     """Reference to a channel containing static guidance."""
 
+    model_config = ConfigDict(frozen=True, revalidate_instances="never")
+
     channel_id: int
     guild_id: int
     label: str
@@ -37,6 +61,8 @@ class PersonaProfile(BaseModel):
 class AutomationRule(BaseModel):
     """Dynamic policy for a channel or trigger."""
 
+    model_config = ConfigDict(frozen=True, revalidate_instances="never")
+
     channel_id: int
     trigger_summary: str
     action: str
@@ -56,6 +82,8 @@ class LLMSettings(BaseModel):
 class MemoryNote(BaseModel):
     """Persistent instructions or reminders set by administrators."""
 
+    model_config = ConfigDict(frozen=True, revalidate_instances="never")
+
     memory_id: int
     guild_id: int
     content: str
@@ -79,6 +107,18 @@ class BotState(BaseModel):
     built_in_prompt: Optional[str] = None
 
 
+@dataclass
+class _StateLocks:
+    """Per-domain write locks so unrelated mutations don't serialize behind each other."""
+
+    guild_config: asyncio.Lock = field(default_factory=asyncio.Lock)
+    persona: asyncio.Lock = field(default_factory=asyncio.Lock)
+    context: asyncio.Lock = field(default_factory=asyncio.Lock)
+    automations: asyncio.Lock = field(default_factory=asyncio.Lock)
+    memories: asyncio.Lock = field(default_factory=asyncio.Lock)
+    llm: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
 class StateStore:
     """Thread-safe state manager backed by database.
 
@@ -92,18 +132,27 @@ class StateStore:
         built_in_prompt: Optional[str] = None,
         initial_llm_settings: Optional[LLMSettings] = None,
     ):
-        self._lock = asyncio.Lock()
+        # Reads go straight to the database; only mutations take their domain's lock
+        self._locks = _StateLocks()
         self._db = database
         self._default_built_in_prompt = built_in_prompt
-        initial_llm = (initial_llm_settings or LLMSettings()).model_copy()
-        self._initial_llm_settings = initial_llm
+        # Only caller-supplied settings need a defensive copy
+        self._initial_llm_settings = (
+            initial_llm_settings.model_copy() if initial_llm_settings else LLMSettings()
+        )
+        self._uses_db_flag = False
+        self._refresh_uses_db()
+        # Memories per guild, each list oldest first; loaded lazily, one guild at a time
+        self._memories: Dict[int, List[MemoryNote]] = {}
+        # Monotonic time each guild's memories were loaded, for MEMORY_CACHE_TTL
+        self._memories_loaded_at: Dict[int, float] = {}
 
     async def load(self) -> None:
         """Initialize LLM settings from database if available."""
-        if not self._uses_db:
+        if not self._refresh_uses_db():
             return
 
-        async with self._lock:
+        async with self._locks.llm:
             # Only load global LLM settings at startup
             stored_llm = await self._db.get_llm_settings()
             if stored_llm and stored_llm.get("api_key"):
@@ -128,146 +177,116 @@ class StateStore:
             guild_id: Guild ID to get state for. Required for per-guild config.
 
         Returns:
-            BotState with guild-specific configuration
+            BotState with guild-specific configuration. The snapshot may share
+            sub-models with the store and must be treated as read-only.
         """
-        if not self._uses_db:
+        if not self._uses_db_flag:
             # No database, return minimal default state
             return BotState(
-                llm=self._initial_llm_settings.model_copy(),
+                llm=self._resolve_llm_settings(None),
                 built_in_prompt=self._default_built_in_prompt,
             )
 
         if guild_id is None:
             # No guild context - return minimal state with just LLM settings
-            async with self._lock:
-                stored_llm = await self._db.get_llm_settings()
-                llm_settings = (
-                    LLMSettings(**stored_llm)
-                    if stored_llm
-                    else self._initial_llm_settings.model_copy()
-                )
-                if not llm_settings.api_key:
-                    llm_settings = self._initial_llm_settings.model_copy()
-                if not llm_settings.model:
-                    llm_settings.model = "gpt-4o-mini"
-                return BotState(
-                    llm=llm_settings,
-                    built_in_prompt=self._default_built_in_prompt,
-                )
-
-        # Fetch all guild-specific data
-        async with self._lock:
-            # 1. Guild config (logs, dry_run, nickname, prompt)
-            guild_config = await self._db.fetch_guild_config(guild_id)
-            logs_channel_id = guild_config.get("logs_channel_id") if guild_config else None
-            dry_run = guild_config.get("dry_run", False) if guild_config else False
-            proactive_moderation = (
-                guild_config.get("proactive_moderation", True) if guild_config else True
-            )
-            bot_nickname = guild_config.get("bot_nickname") if guild_config else None
-            built_in_prompt = (
-                guild_config.get("built_in_prompt")
-                if guild_config
-                else self._default_built_in_prompt
-            )
-
-            # 2. Persona for this guild
-            persona_row = await self._db.fetch_persona(guild_id)
-            if persona_row:
-                interests = persona_row["interests"] or []
-                if isinstance(interests, str):
-                    try:
-                        interests = json.loads(interests)
-                    except json.JSONDecodeError:
-                        interests = []
-                persona = PersonaProfile(
-                    name=persona_row["name"],
-                    description=persona_row["description"],
-                    conversation_style=persona_row["conversation_style"],
-                    interests=list(interests),
-                )
-            else:
-                # Default persona
-                persona = PersonaProfile()
-
-            # 3. Context channels for this guild
-            context_rows = await self._db.fetch_context_channels(guild_id=guild_id)
-            context_channels = {
-                row["channel_id"]: ContextChannel(
-                    channel_id=row["channel_id"],
-                    guild_id=row["guild_id"],
-                    label=row["label"],
-                    notes=row["notes"],
-                    recent_messages=row.get("recent_messages"),
-                    last_fetched=row.get("last_fetched").isoformat()
-                    if row.get("last_fetched")
-                    else None,
-                )
-                for row in context_rows
-            }
-
-            # 4. Memories for this guild
-            memories_rows = await self._db.fetch_memories(guild_id=guild_id)
-            memories: List[MemoryNote] = []
-            for row in memories_rows:
-                mapping = dict(row)
-                created = mapping.get("created_at")
-                memories.append(
-                    MemoryNote(
-                        memory_id=mapping.get("memory_id"),
-                        guild_id=mapping.get("guild_id"),
-                        content=mapping.get("content", ""),
-                        author=mapping.get("author_name", "Unknown"),
-                        author_id=mapping.get("author_id", 0),
-                        created_at=created.isoformat()
-                        if isinstance(created, datetime)
-                        else str(created or ""),
-                    )
-                )
-
-            # 5. Automations (global, but could be filtered by guild if needed)
-            automation_rows = await self._db.fetch_automations()
-            automations: Dict[int, AutomationRule] = {}
-            for row in automation_rows:
-                mapping = dict(row)
-                rule = AutomationRule(
-                    channel_id=mapping.get("channel_id"),
-                    trigger_summary=mapping.get("trigger_summary", ""),
-                    action=mapping.get("action", ""),
-                    justification=mapping.get("justification", ""),
-                    active=mapping.get("active", True),
-                    keywords=list(mapping.get("keywords") or []),
-                )
-                automations[rule.channel_id] = rule
-
-            # 6. LLM settings (global)
             stored_llm = await self._db.get_llm_settings()
-            llm_settings = (
-                LLMSettings(**stored_llm) if stored_llm else self._initial_llm_settings.model_copy()
+            return BotState(
+                llm=self._resolve_llm_settings(stored_llm),
+                built_in_prompt=self._default_built_in_prompt,
             )
-            if not llm_settings.api_key:
-                llm_settings = self._initial_llm_settings.model_copy()
-            if not llm_settings.model:
-                llm_settings.model = "gpt-4o-mini"
 
-            return BotState(
-                context_channels=context_channels,
-                persona=persona,
-                logs_channel_id=logs_channel_id,
-                automations=automations,
-                bot_nickname=bot_nickname,
-                memories=memories,
-                dry_run=dry_run,
-                proactive_moderation=proactive_moderation,
-                llm=llm_settings,
-                built_in_prompt=built_in_prompt,
+        # Fetch all guild-specific data in turn; Database serves one query at a time on a single
+        # connection, so issuing these together would not overlap them
+        guild_config = await self._db.fetch_guild_config(guild_id)
+        persona_row = await self._db.fetch_persona(guild_id)
+        context_rows = await self._db.fetch_context_channels(guild_id=guild_id)
+        guild_memories = await self._cached_memories(guild_id)
+        automation_rows = await self._db.fetch_automations()
+        stored_llm = await self._db.get_llm_settings()
+
+        # 1. Guild config (logs, dry_run, nickname, prompt)
+        logs_channel_id = guild_config.get("logs_channel_id") if guild_config else None
+        dry_run = guild_config.get("dry_run", False) if guild_config else False
+        proactive_moderation = (
+            guild_config.get("proactive_moderation", True) if guild_config else True
+        )
+        bot_nickname = guild_config.get("bot_nickname") if guild_config else None
+        built_in_prompt = (
+            guild_config.get("built_in_prompt") if guild_config else self._default_built_in_prompt
+        )
+
+        # 2. Persona for this guild
+        if persona_row:
+            interests = persona_row["interests"] or []
+            if isinstance(interests, str):
+                try:
+                    interests = json.loads(interests)
+                except json.JSONDecodeError:
+                    interests = []
+            persona = PersonaProfile.model_construct(
+                name=persona_row["name"],
+                description=persona_row["description"],
+                conversation_style=persona_row["conversation_style"],
+                interests=list(interests),
             )
+        else:
+            # Default persona
+            persona = PersonaProfile()
+
+        # 3. Context channels for this guild
+        context_channels = {
+            row["channel_id"]: _context_channel_from_row(row) for row in context_rows
+        }
+
+        # 4. Memories for this guild (newest first)
+        memories = guild_memories[::-1]
+
+        # 5. Automations (global, but could be filtered by guild if needed)
+        automations: Dict[int, AutomationRule] = {}
+        for row in automation_rows:
+            mapping = dict(row)
+            rule = AutomationRule.model_construct(
+                channel_id=mapping.get("channel_id"),
+                trigger_summary=mapping.get("trigger_summary", ""),
+                action=mapping.get("action", ""),
+                justification=mapping.get("justification", ""),
+                active=mapping.get("active", True),
+                keywords=list(mapping.get("keywords") or []),
+            )
+            automations[rule.channel_id] = rule
+
+        # 6. LLM settings (global)
+        llm_settings = self._resolve_llm_settings(stored_llm)
+
+        # Rows are trusted database output; skip re-validating them into the snapshot
+        return BotState.model_construct(
+            context_channels=context_channels,
+            persona=persona,
+            logs_channel_id=logs_channel_id,
+            automations=automations,
+            bot_nickname=bot_nickname,
+            memories=memories,
+            dry_run=dry_run,
+            proactive_moderation=proactive_moderation,
+            llm=llm_settings,
+            built_in_prompt=built_in_prompt,
+        )
+
+    def _resolve_llm_settings(self, stored_llm: Optional[Dict[str, Optional[str]]]) -> LLMSettings:
+        """Pick stored LLM settings, falling back to the initial settings without copying."""
+        if stored_llm and stored_llm.get("api_key"):
+            settings = LLMSettings(**stored_llm)
+        else:
+            settings = self._initial_llm_settings
+        if not settings.model:
+            settings = settings.model_copy(update={"model": "gpt-4o-mini"})
+        return settings
 
     async def add_context_channel(self, channel: ContextChannel) -> None:
         """Add or update a context channel for a guild."""
-        if not self._uses_db:
+        if not self._uses_db_flag:
             return
-        async with self._lock:
+        async with self._locks.context:
             await self._db.upsert_context_channel(
                 channel_id=channel.channel_id,
                 guild_id=channel.guild_id,
@@ -277,11 +296,30 @@ class StateStore:
                 last_fetched=channel.last_fetched,
             )
 
+    async def bulk_add_context_channels(self, channels: List[ContextChannel]) -> None:
+        """Add or update many context channels in a single database round trip."""
+        if not self._uses_db_flag or not channels:
+            return
+        async with self._locks.context:
+            await self._db.bulk_upsert_context_channels(
+                [
+                    {
+                        "channel_id": channel.channel_id,
+                        "guild_id": channel.guild_id,
+                        "label": channel.label,
+                        "notes": channel.notes,
+                        "recent_messages": channel.recent_messages,
+                        "last_fetched": channel.last_fetched,
+                    }
+                    for channel in channels
+                ],
+            )
+
     async def remove_context_channel(self, channel_id: int) -> bool:
         """Remove a context channel."""
-        if not self._uses_db:
+        if not self._uses_db_flag:
             return False
-        async with self._lock:
+        async with self._locks.context:
             await self._db.delete_context_channel(channel_id)
             return True
 
@@ -296,48 +334,37 @@ class StateStore:
         Returns:
             True if refreshed successfully, False if channel not found
         """
-        # Fetch channel from Discord to determine guild_id
+        if not self._uses_db_flag:
+            return False
+
         try:
             channel = bot.get_channel(channel_id)
             if not channel or not hasattr(channel, "guild"):
                 return False
 
-            guild_id = channel.guild.id
-
-            # Get current state for this guild
-            async with self._lock:
-                current_state = await self.get_state(guild_id=guild_id)
-                if channel_id not in current_state.context_channels:
-                    return False
-
-                ctx = current_state.context_channels[channel_id]
-
-            from datetime import datetime
-            from datetime import timezone as tz
+            # Look up just this context channel rather than building the whole guild state
+            row = await self._db.fetch_context_channel(channel_id)
+            if not row or row["guild_id"] != channel.guild.id:
+                return False
+            ctx = _context_channel_from_row(row)
 
             recent_messages = await fetch_channel_context(
                 channel, message_limit=50, llm_client=llm_client
             )
 
-            # Update with new content
-            updated_channel = ContextChannel(
-                channel_id=ctx.channel_id,
-                guild_id=ctx.guild_id,
-                label=ctx.label,
-                notes=ctx.notes,
-                recent_messages=recent_messages,
-                last_fetched=datetime.now(tz.utc).isoformat(),
+            # Update with new content (model_copy skips re-validating unchanged fields)
+            updated_channel = ctx.model_copy(
+                update={
+                    "recent_messages": recent_messages,
+                    "last_fetched": datetime.now(timezone.utc).isoformat(),
+                }
             )
 
             await self.add_context_channel(updated_channel)
             return True
 
         except Exception as e:
-            import logging
-
-            logging.getLogger(__name__).warning(
-                f"Failed to refresh context channel {channel_id}: {e}"
-            )
+            logger.warning(f"Failed to refresh context channel {channel_id}: {e}")
             return False
 
     async def refresh_all_context_channels(self, bot, llm_client) -> int:
@@ -350,48 +377,56 @@ class StateStore:
         Returns:
             Number of channels successfully refreshed
         """
-        import logging
-
-        logger = logging.getLogger(__name__)
+        if not self._uses_db_flag:
+            return 0
+
+        # One query for every guild's context channels instead of a full state build per guild
+        guild_ids = {guild.id for guild in bot.guilds}
+        context_rows = await self._db.fetch_context_channels()
+        targets = [
+            (row["channel_id"], row["guild_id"])
+            for row in context_rows
+            if row["guild_id"] in guild_ids
+        ]
+        if not targets:
+            return 0
+
+        # Fan the refreshes out, capping concurrent Discord history fetches and LLM calls
+        semaphore = asyncio.Semaphore(CONTEXT_REFRESH_CONCURRENCY)
+
+        async def _refresh(channel_id: int) -> bool:
+            async with semaphore:
+                return await self.refresh_context_channel(channel_id, bot, llm_client)
+
+        results = await asyncio.gather(
+            *(_refresh(channel_id) for channel_id, _ in targets), return_exceptions=True
+        )
 
         refreshed = 0
-        total_channels = 0
-
-        # Iterate through all guilds and refresh their context channels
-        for guild in bot.guilds:
-            guild_state = await self.get_state(guild_id=guild.id)
-            if not guild_state.context_channels:
-                continue
+        for (channel_id, guild_id), result in zip(targets, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    f"Failed to refresh context channel {channel_id} in guild {guild_id}: {result}"
+                )
+            elif result:
+                refreshed += 1
+                logger.info(f"Refreshed context channel {channel_id} in guild {guild_id}")
 
-            total_channels += len(guild_state.context_channels)
-            for channel_id in list(guild_state.context_channels.keys()):
-                try:
-                    if await self.refresh_context_channel(channel_id, bot, llm_client):
-                        refreshed += 1
-                        logger.info(f"Refreshed context channel {channel_id} in guild {guild.id}")
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to refresh context channel {channel_id} in guild {guild.id}: {e}"
-                    )
-
-        if total_channels > 0:
-            logger.info(
-                f"Refreshed {refreshed}/{total_channels} context channels across all guilds"
-            )
+        logger.info(f"Refreshed {refreshed}/{len(targets)} context channels across all guilds")
         return refreshed
 
     async def set_logs_channel(self, guild_id: int, channel_id: Optional[int]) -> None:
         """Set the logs channel for a guild."""
-        if not self._uses_db:
+        if not self._uses_db_flag:
             return
-        async with self._lock:
+        async with self._locks.guild_config:
             await self._db.upsert_guild_config(guild_id=guild_id, logs_channel_id=channel_id)
 
     async def upsert_automation(self, rule: AutomationRule) -> None:
         """Add or update an automation rule."""
-        if not self._uses_db:
+        if not self._uses_db_flag:
             return
-        async with self._lock:
+        async with self._locks.automations:
             await self._db.upsert_automation(
                 channel_id=rule.channel_id,
                 trigger_summary=rule.trigger_summary,
@@ -403,17 +438,17 @@ class StateStore:
 
     async def deactivate_automation(self, channel_id: int) -> bool:
         """Deactivate an automation rule."""
-        if not self._uses_db:
+        if not self._uses_db_flag:
             return False
-        async with self._lock:
+        async with self._locks.automations:
             await self._db.deactivate_automation(channel_id)
             return True
 
     async def set_persona(self, guild_id: int, persona: PersonaProfile) -> None:
         """Set the persona for a guild."""
-        if not self._uses_db:
+        if not self._uses_db_flag:
             return
-        async with self._lock:
+        async with self._locks.persona:
             await self._db.set_persona(
                 guild_id=guild_id,
                 name=persona.name,
@@ -430,7 +465,7 @@ class StateStore:
         author_id: int,
     ) -> MemoryNote:
         """Add a memory note for a guild."""
-        if not self._uses_db:
+        if not self._uses_db_flag:
             # Without database, create in-memory note
             note = MemoryNote(
                 memory_id=1,
@@ -442,66 +477,67 @@ class StateStore:
             )
             return note
 
-        async with self._lock:
+        async with self._locks.memories:
             record = await self._db.add_memory(
                 guild_id=guild_id,
                 content=content,
                 author=author,
                 author_id=author_id,
             )
-            note = MemoryNote(
-                memory_id=record["memory_id"],
-                guild_id=record["guild_id"],
-                content=record["content"],
-                author=record["author_name"],
-                author_id=record["author_id"],
-                created_at=record["created_at"].isoformat() if record["created_at"] else "",
-            )
+            note = _memory_note_from_row(record)
+            if note.guild_id in self._memories:
+                # The cache is already ordered, so place the note instead of re-sorting
+                bisect.insort(self._memories[note.guild_id], note, key=_memory_sort_key)
             return note
 
     async def list_memories(self, guild_id: int) -> List[MemoryNote]:
         """List all memories for a guild."""
-        if not self._uses_db:
+        if not self._uses_db_flag:
             return []
-        async with self._lock:
-            memories_rows = await self._db.fetch_memories(guild_id=guild_id)
-            memories: List[MemoryNote] = []
-            for row in memories_rows:
-                mapping = dict(row)
-                created = mapping.get("created_at")
-                memories.append(
-                    MemoryNote(
-                        memory_id=mapping.get("memory_id"),
-                        guild_id=mapping.get("guild_id"),
-                        content=mapping.get("content", ""),
-                        author=mapping.get("author_name", "Unknown"),
-                        author_id=mapping.get("author_id", 0),
-                        created_at=created.isoformat()
-                        if isinstance(created, datetime)
-                        else str(created or ""),
-                    )
-                )
-            return memories
+        return (await self._cached_memories(guild_id))[::-1]
+
+    async def _cached_memories(self, guild_id: int) -> List[MemoryNote]:
+        """Return a guild's memories (oldest first), reloading them once they expire."""
+        if self._memories_stale(guild_id):
+            async with self._locks.memories:
+                if self._memories_stale(guild_id):
+                    # fetch_memories returns newest first
+                    rows = await self._db.fetch_memories(guild_id=guild_id)
+                    self._memories[guild_id] = [
+                        _memory_note_from_row(row) for row in reversed(rows)
+                    ]
+                    self._memories_loaded_at[guild_id] = time.monotonic()
+        return self._memories[guild_id]
+
+    def _memories_stale(self, guild_id: int) -> bool:
+        """Whether a guild's memories are not cached or older than MEMORY_CACHE_TTL."""
+        loaded_at = self._memories_loaded_at.get(guild_id)
+        return loaded_at is None or time.monotonic() - loaded_at >= MEMORY_CACHE_TTL
 
     async def remove_memory(self, guild_id: int, memory_id: int) -> bool:
         """Remove a memory from a guild."""
-        if not self._uses_db:
+        if not self._uses_db_flag:
             return False
-        async with self._lock:
-            return await self._db.delete_memory(guild_id, memory_id)
+        async with self._locks.memories:
+            removed = await self._db.delete_memory(guild_id, memory_id)
+            if removed and guild_id in self._memories:
+                self._memories[guild_id] = [
+                    note for note in self._memories[guild_id] if note.memory_id != memory_id
+                ]
+            return removed
 
     async def set_dry_run(self, guild_id: int, enabled: bool) -> None:
         """Set dry-run mode for a guild."""
-        if not self._uses_db:
+        if not self._uses_db_flag:
             return
-        async with self._lock:
+        async with self._locks.guild_config:
             await self._db.upsert_guild_config(guild_id=guild_id, dry_run=enabled)
 
     async def set_proactive_moderation(self, guild_id: int, enabled: bool) -> None:
         """Set proactive moderation mode for a guild."""
-        if not self._uses_db:
+        if not self._uses_db_flag:
             return
-        async with self._lock:
+        async with self._locks.guild_config:
             await self._db.upsert_guild_config(guild_id=guild_id, proactive_moderation=enabled)
 
     @property
@@ -511,35 +547,73 @@ class StateStore:
 
     async def set_built_in_prompt(self, guild_id: int, prompt: Optional[str]) -> None:
         """Set the built-in prompt for a guild."""
-        if not self._uses_db:
+        if not self._uses_db_flag:
             return
-        async with self._lock:
+        async with self._locks.guild_config:
             await self._db.upsert_guild_config(guild_id=guild_id, built_in_prompt=prompt)
 
     async def set_llm_settings(self, settings: LLMSettings) -> None:
-        async with self._lock:
+        async with self._locks.llm:
             settings = settings.model_copy()
             self._initial_llm_settings = settings
-            if self._uses_db:
-                await self._db.set_llm_settings(
-                    api_key=settings.api_key,
-                    model=settings.model,
-                    base_url=settings.base_url,
-                )
+            if not self._uses_db_flag:
+                return
+            await self._db.set_llm_settings(
+                api_key=settings.api_key,
+                model=settings.model,
+                base_url=settings.base_url,
+            )
 
     # Legacy: command_prefix removed - using slash commands exclusively
 
     async def set_bot_nickname(self, guild_id: int, nickname: Optional[str]) -> None:
         """Set the bot nickname for a guild."""
-        if not self._uses_db:
+        if not self._uses_db_flag:
             return
-        async with self._lock:
+        async with self._locks.guild_config:
             cleaned = nickname.strip() if nickname and nickname.strip() else None
             await self._db.upsert_guild_config(guild_id=guild_id, bot_nickname=cleaned)
 
-    @property
-    def _uses_db(self) -> bool:
-        return self._db is not None and self._db.is_connected
+    def _refresh_uses_db(self) -> bool:
+        """Re-evaluate whether the database backend is available and cache the result."""
+        self._uses_db_flag = self._db is not None and self._db.is_connected
+        return self._uses_db_flag
+
+
+def _context_channel_from_row(row) -> ContextChannel:
+    """Build a ContextChannel from a trusted context_channels database row."""
+    last_fetched = row.get("last_fetched")
+    return ContextChannel.model_construct(
+        channel_id=row["channel_id"],
+        guild_id=row["guild_id"],
+        label=row["label"],
+        notes=row["notes"],
+        recent_messages=row.get("recent_messages"),
+        last_fetched=last_fetched.isoformat() if last_fetched else None,
+    )
+
+
+def _memory_note_from_row(row) -> MemoryNote:
+    """Build a MemoryNote from a trusted memories database row."""
+    created = row.get("created_at")
+    return MemoryNote.model_construct(
+        memory_id=row.get("memory_id"),
+        guild_id=row.get("guild_id"),
+        content=row.get("content") or "",
+        author=row.get("author_name") or "Unknown",
+        author_id=row.get("author_id") or 0,
+        created_at=created.isoformat() if isinstance(created, datetime) else str(created or ""),
+    )
+
+
+def _memory_sort_key(note: MemoryNote) -> datetime:
+    # Compare instants rather than strings so notes with different UTC offsets still order
+    try:
+        created = datetime.fromisoformat(note.created_at)
+    except ValueError:
+        return datetime.min.replace(tzinfo=timezone.utc)
+    # Naive timestamps are treated as UTC so they compare with aware ones
+    return created if created.tzinfo else created.replace(tzinfo=timezone.utc)
 
 
 async def fetch_channel_context(channel, message_limit: int = 50, llm_client=None) -> str:
@@ -553,36 +627,37 @@ async def fetch_channel_context(channel, message_limit: int = 50, llm_client=Non
     Returns:
         Summarized string containing key points from recent messages
     """
-    import discord
-
     try:
-        messages = []
+        # History arrives newest first; prepending leaves the deque in chronological order
+        messages: deque[str] = deque()
         async for message in channel.history(limit=message_limit, oldest_first=False):
             # Skip bot messages
             if message.author.bot:
                 continue
 
             # Format message with timestamp and author
-            timestamp = message.created_at.strftime("%Y-%m-%d %H:%M")
-            content = message.content[:500]  # Get more content for better summarization
-            if len(message.content) > 500:
-                content += "..."
-            messages.append(f"[{timestamp}] {message.author.name}: {content}")
+            timestamp = message.created_at.isoformat(sep=" ", timespec="minutes")[:16]
+            # Get more content for better summarization
+            content = message.content
+            if len(content) > 500:
+                content = content[:500] + "..."
+            messages.appendleft(f"[{timestamp}] {message.author.name}: {content}")
 
         if not messages:
             return "No recent messages found in this channel."
 
-        # Reverse to show chronological order (oldest to newest)
-        messages.reverse()
-
-        # Get the raw message text
-        raw_messages = "\n".join(messages[-50:])  # Use up to 50 messages for summarization
+        # Get the raw message text (already chronological, at most message_limit entries)
+        raw_messages = "\n".join(messages)
 
-        # If LLM client is available, summarize the messages
+        # If LLM client is available, summarize the messages (unchanged channels reuse the last summary)
         if llm_client:
-            try:
-                from .llm import LLMUnavailable
+            cache_key = hashlib.blake2b(raw_messages.encode(), digest_size=16).hexdigest()
+            cached = _SUMMARY_CACHE.get(cache_key)
+            if cached is not None:
+                _SUMMARY_CACHE.move_to_end(cache_key)
+                return cached
 
+            try:
                 summary_prompt = f"""Summarize the following Discord channel messages into a concise overview.
 Focus on:
 - Main topics of discussion
@@ -605,6 +680,9 @@ Provide a clear, factual summary:"""
 
                 summary = result.get("message", {}).get("content", "").strip()
                 if summary:
+                    _SUMMARY_CACHE[cache_key] = summary
+                    if len(_SUMMARY_CACHE) > _SUMMARY_CACHE_SIZE:
+                        _SUMMARY_CACHE.popitem(last=False)
                     return summary
 
             except LLMUnavailable:
@@ -612,13 +690,11 @@ Provide a clear, factual summary:"""
                 pass
             except Exception as e:
                 # Fall back to raw messages on any error
-                import logging
-
-                logging.getLogger(__name__).warning(f"Failed to summarize channel context: {e}")
+                logger.warning(f"Failed to summarize channel context: {e}")
 
         # Fallback: return condensed version without LLM summarization
         # Just show the last 15 messages
-        return "\n".join(messages[-15:])
+        return "\n".join(islice(messages, max(len(messages) - 15, 0), None))
 
     except discord.Forbidden:
         return "Unable to read message history (missing permissions)."
@@ -632,8 +708,9 @@ def format_context_channels(channels: Dict[int, ContextChannel]) -> str:
     if not channels:
         return "No context channels configured yet."
 
-    lines = [
-        f"- #{ctx.label} (id={channel_id}): {ctx.notes or 'No notes provided.'}"
-        for channel_id, ctx in channels.items()
-    ]
-    return "\n".join(lines)
+    return "\n".join(
+        [
+            f"- #{ctx.label} (id={channel_id}): {ctx.notes or 'No notes provided.'}"
+            for channel_id, ctx in channels.items()
+        ]
+    )
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import re
 from typing import List
 
 # Discord's maximum message length
 DISCORD_MAX_MESSAGE_LENGTH = 2000
 
+_LEADING_WHITESPACE = re.compile(r"\s*")
+
 
 def split_message(content: str, max_length: int = DISCORD_MAX_MESSAGE_LENGTH) -> List[str]:
     """Split a message into chunks that fit within Discord's character limit.
@@ -37,40 +40,53 @@ def split_message(content: str, max_length: int = DISCORD_MAX_MESSAGE_LENGTH) ->
         return [content]
 
     chunks: List[str] = []
-    remaining = content
-
-    while remaining:
-        if len(remaining) <= max_length:
-            chunks.append(remaining)
+    # Walk the original string with an offset instead of re-slicing the remainder,
+    # and let str.rfind do every boundary search in C
+    pos = 0
+    length = len(content)
+    min_split = int(max_length * 0.5)
+
+    while pos < length:
+        if length - pos <= max_length:
+            chunks.append(content[pos:])
             break
 
+        window_end = pos + max_length
         # Find the best split point within max_length
         split_point = max_length
 
         # Try to split at a newline (paragraph boundary)
-        newline_pos = remaining.rfind("\n", 0, max_length)
+        newline_pos = content.rfind("\n", pos, window_end) - pos
         if newline_pos > max_length * 0.5:  # Only use if it's past halfway point
             split_point = newline_pos + 1  # Include the newline in current chunk
 
         # If no good newline, try to split at a sentence boundary
-        elif "." in remaining[:max_length]:
-            # Look for sentence endings: period followed by space or end
-            for i in range(max_length - 1, int(max_length * 0.5), -1):
-                if remaining[i] == "." and (i + 1 >= len(remaining) or remaining[i + 1] in " \n"):
-                    split_point = i + 1
-                    break
+        elif content.find(".", pos, window_end) != -1:
+            # Look for sentence endings: period followed by space or newline
+            lo = pos + min_split + 1
+            sentence_end = max(
+                content.rfind(". ", lo, window_end + 1),
+                content.rfind(".\n", lo, window_end + 1),
+            )
+            if sentence_end != -1:
+                split_point = sentence_end - pos + 1
 
         # If no sentence boundary, try to split at a word boundary
         else:
-            space_pos = remaining.rfind(" ", 0, max_length)
+            space_pos = content.rfind(" ", pos, window_end) - pos
             if space_pos > max_length * 0.5:  # Only use if it's past halfway point
                 split_point = space_pos + 1  # Include the space
 
-        # Extract the chunk and update remaining
-        chunk = remaining[:split_point].rstrip()
+        # Extract the chunk and advance past the split point
+        chunk = content[pos : pos + split_point].rstrip()
         if chunk:  # Only add non-empty chunks
             chunks.append(chunk)
 
-        remaining = remaining[split_point:].lstrip()
+        pos = _skip_whitespace(content, pos + split_point)
 
     return chunks
+
+
+def _skip_whitespace(content: str, pos: int) -> int:
+    """Return the index of the first non-whitespace character at or after pos."""
+    return _LEADING_WHITESPACE.match(content, pos).end()
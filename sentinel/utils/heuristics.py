@@ -0,0 +1,247 @@
+"""Compiled matching of heuristic rules against message content."""
+
+from __future__ import annotations
+
+import logging
+import re
+import sys
+from collections import OrderedDict
+from difflib import SequenceMatcher
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Set, Tuple
+
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:  # pragma: no cover - Python 3.10
+    import sre_parse
+
+try:
+    import hyperscan
+except ImportError:  # pragma: no cover - optional accelerator
+    hyperscan = None  # type: ignore
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional accelerator
+    ahocorasick = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+# (rule id, pattern type, pattern) for every rule, in evaluation order
+_RuleKey = Tuple[Tuple[Any, str, str], ...]
+
+# Matchers keyed by the rule set they were built from (one entry per distinct guild rule set)
+_MATCHER_CACHE: "OrderedDict[_RuleKey, HeuristicMatcher]" = OrderedDict()
+_MATCHER_CACHE_SIZE = 64
+
+# Constructs whose meaning depends on group numbers or names, which fusing patterns would change
+_UNFUSABLE = re.compile(r"\\[1-9]|\(\?P|\(\?\(")
+
+_UPPERCASE = range(ord("A"), ord("Z") + 1)
+
+
+class HeuristicMatcher:
+    """Finds the first heuristic rule, in order, that matches a message.
+
+    Exact and regex patterns are compiled once when the matcher is built. Those that allow
+    it are also fused into one case-sensitive alternation that rejects ASCII messages matching
+    none of them in a single scan. All `contains` rules are resolved together in one pass over
+    the message: with a Hyperscan literal database or an Aho-Corasick automaton when either
+    library is installed, otherwise with one substring check per distinct needle. Other rule
+    types are evaluated in order as they are reached.
+    """
+
+    def __init__(self, rules: Sequence[Mapping[str, Any]]):
+        # (pattern type, pattern, compiled regex for exact/regex rules) in evaluation order
+        self._rules: List[Tuple[str, str, Optional[re.Pattern[str]]]] = []
+        # Lowercased needle -> indices of the contains rules that use it
+        self._needles: Dict[str, List[int]] = {}
+
+        for index, rule in enumerate(rules):
+            # Rows carry fresh strings; interning lets the dispatch below compare by identity
+            pattern_type, pattern = sys.intern(rule["pattern_type"]), rule["pattern"]
+            compiled = None
+            if pattern_type == "exact":
+                # Exact word match with word boundaries
+                compiled = re.compile(r"\b" + re.escape(pattern.lower()) + r"\b")
+            elif pattern_type == "regex":
+                try:
+                    compiled = re.compile(pattern, re.IGNORECASE)
+                except re.error:
+                    # Logged once per rule set; the rule can never match
+                    logger.warning(f"Invalid regex in heuristic {rule['id']}: {pattern}")
+            elif pattern_type == "contains":
+                self._needles.setdefault(pattern.lower(), []).append(index)
+            self._rules.append((pattern_type, pattern, compiled))
+
+        # Shortest first, so the plain scan can stop at the first needle longer than the message
+        self._needle_order = sorted(self._needles, key=len)
+        # Messages shorter than this cannot contain any non-empty needle
+        self._min_needle_len = min((len(needle) for needle in self._needles if needle), default=0)
+
+        # Without IGNORECASE or named groups; both slow a large alternation below the
+        # cost of searching each pattern separately
+        self._union: Optional[re.Pattern[str]] = None
+        self._fused: Set[int] = set()
+        branches = []
+        for index, (_, _, compiled) in enumerate(self._rules):
+            if compiled is not None and _is_fusable(compiled.pattern):
+                branches.append(f"(?:{compiled.pattern})")
+                self._fused.add(index)
+        if branches:
+            try:
+                self._union = re.compile("|".join(branches))
+            except re.error:
+                self._fused.clear()
+
+        self._hyperscan = None
+        # Hyperscan expression id -> indices of the contains rules using that needle
+        self._hyperscan_groups: List[List[int]] = []
+        self._automaton = None
+        if hyperscan is not None and any(self._needles):
+            needles = [needle for needle in self._needles if needle]
+            database = hyperscan.Database()
+            database.compile(
+                expressions=[needle.encode("utf-8", "surrogatepass") for needle in needles],
+                ids=list(range(len(needles))),
+                elements=len(needles),
+                flags=hyperscan.HS_FLAG_SINGLEMATCH,
+                literal=True,
+            )
+            self._hyperscan = database
+            self._hyperscan_groups = [self._needles[needle] for needle in needles]
+        elif ahocorasick is not None and any(self._needles):
+            automaton = ahocorasick.Automaton()
+            for needle, indices in self._needles.items():
+                if needle:
+                    automaton.add_word(needle, indices)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def match(self, content: str) -> Optional[int]:
+        """Return the index of the first rule matching content, or None."""
+        content_lower = content.lower()
+        contains_hits: Optional[Set[int]] = None
+
+        # On lowercased ASCII text the case-sensitive union matches exactly when a fused rule would
+        union_miss = (
+            self._union is not None
+            and content_lower.isascii()
+            and self._union.search(content_lower) is None
+        )
+
+        for index, (pattern_type, pattern, compiled) in enumerate(self._rules):
+            if compiled is not None:
+                if union_miss and index in self._fused:
+                    continue
+                if compiled.search(content_lower):
+                    return index
+
+            elif pattern_type == "fuzzy":
+                # Fuzzy matching (allows typos, character substitution)
+                if SequenceMatcher(None, pattern.lower(), content_lower).ratio() > 0.85:
+                    return index
+
+            elif pattern_type == "contains":
+                if contains_hits is None:
+                    contains_hits = self._contains_hits(content_lower)
+                if index in contains_hits:
+                    return index
+
+        return None
+
+    def _contains_hits(self, content_lower: str) -> Set[int]:
+        """Indices of every contains rule whose needle occurs in content_lower."""
+        hits: Set[int] = set()
+        if len(content_lower) < self._min_needle_len:
+            pass  # Too short to contain any non-empty needle
+        elif self._hyperscan is not None:
+            # UTF-8 is self-synchronizing, so byte substring hits are exactly str substring hits
+            matched: List[int] = []
+            self._hyperscan.scan(
+                content_lower.encode("utf-8", "surrogatepass"),
+                match_event_handler=lambda expression_id, *_: matched.append(expression_id),
+            )
+            for expression_id in matched:
+                hits.update(self._hyperscan_groups[expression_id])
+        elif self._automaton is not None:
+            for _, indices in self._automaton.iter(content_lower):
+                hits.update(indices)
+        else:
+            for needle in self._needle_order:
+                if len(needle) > len(content_lower):
+                    break
+                if needle in content_lower:
+                    hits.update(self._needles[needle])
+            return hits
+
+        # Neither the accelerators nor the length check account for an empty needle, which
+        # trivially matches
+        hits.update(self._needles.get("", ()))
+        return hits
+
+
+def _is_fusable(pattern: str) -> bool:
+    """Whether pattern can be embedded as one branch of a case-sensitive alternation.
+
+    Non-ASCII patterns, and patterns that can match an uppercase letter without also matching
+    its lowercase form (e.g. [A-Z], \\x46, [@-\\[]), rely on IGNORECASE against lowercased
+    content, so those patterns are left to match on their own.
+    """
+    if not pattern.isascii() or _UNFUSABLE.search(pattern):
+        return False
+    try:
+        re.compile(f"(?:{pattern})")
+        parsed = sre_parse.parse(pattern)
+    except re.error:
+        return False
+    return _is_case_invariant(parsed)
+
+
+def _is_case_invariant(parsed) -> bool:
+    """Whether a parsed pattern matches lowercased ASCII text the same with or without IGNORECASE.
+
+    On such text IGNORECASE only adds matches where an item accepts an uppercase letter but not
+    its lowercase form, so every literal and character set is checked for that. Escapes have
+    already been resolved to code points by the parser.
+    """
+    for op, av in parsed:
+        if op in (sre_parse.LITERAL, sre_parse.NOT_LITERAL):
+            if av in _UPPERCASE:
+                return False
+        elif op == sre_parse.IN:
+            accepted = set()
+            for item_op, item_av in av:
+                if item_op == sre_parse.LITERAL:
+                    accepted.add(item_av)
+                elif item_op == sre_parse.RANGE:
+                    low, high = item_av
+                    accepted.update(range(max(low, ord("A")), min(high, ord("z")) + 1))
+            if any(char in accepted and char + 32 not in accepted for char in _UPPERCASE):
+                return False
+        elif not all(_is_case_invariant(nested) for nested in _nested_patterns(av)):
+            return False
+    return True
+
+
+def _nested_patterns(av):
+    """Yield the sub-patterns held by a parsed op's arguments (groups, repeats, branches)."""
+    if isinstance(av, sre_parse.SubPattern):
+        yield av
+    elif isinstance(av, (tuple, list)):
+        for item in av:
+            yield from _nested_patterns(item)
+
+
+def get_matcher(rules: Sequence[Mapping[str, Any]]) -> HeuristicMatcher:
+    """Return a matcher for rules, reusing the one built for an identical rule set."""
+    key: _RuleKey = tuple((rule["id"], rule["pattern_type"], rule["pattern"]) for rule in rules)
+    matcher = _MATCHER_CACHE.get(key)
+    if matcher is not None:
+        _MATCHER_CACHE.move_to_end(key)
+        return matcher
+
+    matcher = HeuristicMatcher(rules)
+    _MATCHER_CACHE[key] = matcher
+    if len(_MATCHER_CACHE) > _MATCHER_CACHE_SIZE:
+        _MATCHER_CACHE.popitem(last=False)
+    return matcher
@@ -0,0 +1,85 @@
+"""Tests for cached context channel summaries."""
+
+import asyncio
+from collections import OrderedDict
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from sentinel.services import state as state_module
+from sentinel.services.state import fetch_channel_context
+
+
+class CountingLLM:
+    """Fake LLM client that numbers its summaries and counts the calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def run(self, messages, max_tokens):
+        self.calls += 1
+        return {"message": {"content": f"summary {self.calls}"}}
+
+
+class FakeChannel:
+    """Channel whose history is a fixed list of user messages."""
+
+    def __init__(self, *contents):
+        author = SimpleNamespace(bot=False, name="member")
+        created_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        self._messages = [
+            SimpleNamespace(author=author, created_at=created_at, content=content)
+            for content in contents
+        ]
+
+    async def history(self, limit, oldest_first):
+        for message in reversed(self._messages[-limit:]):
+            yield message
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    """Give each test its own summary cache."""
+    monkeypatch.setattr(state_module, "_SUMMARY_CACHE", OrderedDict())
+
+
+def _summarize(channel, llm):
+    return asyncio.run(fetch_channel_context(channel, llm_client=llm))
+
+
+class TestSummaryCache:
+    """Test suite for reusing and evicting channel summaries."""
+
+    def test_unchanged_messages_skip_llm(self):
+        """Summarizing the same messages again should reuse the earlier summary."""
+        llm = CountingLLM()
+
+        first = _summarize(FakeChannel("hello", "rules are pinned"), llm)
+        second = _summarize(FakeChannel("hello", "rules are pinned"), llm)
+
+        assert first == second == "summary 1"
+        assert llm.calls == 1
+
+    def test_changed_messages_call_llm(self):
+        """A new message should produce a fresh summary."""
+        llm = CountingLLM()
+
+        _summarize(FakeChannel("hello"), llm)
+        assert _summarize(FakeChannel("hello", "new announcement"), llm) == "summary 2"
+        assert llm.calls == 2
+
+    def test_oldest_summary_is_evicted(self):
+        """Past the size bound the least recently used summary should be dropped."""
+        llm = CountingLLM()
+        size = state_module._SUMMARY_CACHE_SIZE
+
+        for index in range(size + 1):
+            _summarize(FakeChannel(f"message {index}"), llm)
+
+        assert len(state_module._SUMMARY_CACHE) == size
+        # The most recent entries are still cached, the first one was evicted
+        _summarize(FakeChannel(f"message {size}"), llm)
+        assert llm.calls == size + 1
+        _summarize(FakeChannel("message 0"), llm)
+        assert llm.calls == size + 2
@@ -0,0 +1,119 @@
+"""Tests for compiled heuristic rule matching."""
+
+import re
+
+import pytest
+
+from sentinel.utils.heuristics import HeuristicMatcher, get_matcher
+
+
+def _rule(rule_id: int, pattern: str, pattern_type: str) -> dict:
+    return {"id": rule_id, "pattern": pattern, "pattern_type": pattern_type}
+
+
+class TestHeuristicMatcher:
+    """Test suite for first-match heuristic evaluation."""
+
+    def test_contains_is_case_insensitive(self):
+        """Contains rules should match regardless of case."""
+        matcher = HeuristicMatcher([_rule(1, "Free Gift", "contains")])
+
+        assert matcher.match("claim your FREE GIFT now") == 0
+        assert matcher.match("nothing to see here") is None
+
+    def test_first_rule_in_order_wins(self):
+        """When several rules match, the earliest rule in the list is reported."""
+        rules = [
+            _rule(1, "never matches", "contains"),
+            _rule(2, r"gift\s+card", "regex"),
+            _rule(3, "gift", "contains"),
+        ]
+
+        assert HeuristicMatcher(rules).match("buy a gift card") == 1
+        assert HeuristicMatcher(rules).match("a gift for you") == 2
+
+    def test_shared_needles_report_earliest_rule(self):
+        """Duplicate contains needles should resolve to the first rule using them."""
+        rules = [_rule(1, "scam", "contains"), _rule(2, "SCAM", "contains")]
+
+        assert HeuristicMatcher(rules).match("this is a scam") == 0
+
+    def test_short_messages_still_match_short_needles(self):
+        """Messages shorter than some needles should still be checked against the rest."""
+        rules = [_rule(1, "free nitro giveaway", "contains"), _rule(2, "gg", "contains")]
+        matcher = HeuristicMatcher(rules)
+
+        assert matcher.match("gg") == 1
+        assert matcher.match("g") is None
+
+    def test_exact_uses_word_boundaries(self):
+        """Exact rules should only match whole words."""
+        matcher = HeuristicMatcher([_rule(1, "nitro", "exact")])
+
+        assert matcher.match("free nitro here") == 0
+        assert matcher.match("nitroglycerin") is None
+
+    def test_invalid_regex_is_skipped(self):
+        """A broken regex should not stop later rules from matching."""
+        rules = [_rule(1, "(unclosed", "regex"), _rule(2, "spam", "contains")]
+
+        assert HeuristicMatcher(rules).match("spam spam") == 1
+
+    def test_group_references_survive_fusing(self):
+        """Patterns using backreferences or named groups should still match on their own."""
+        rules = [
+            _rule(1, r"(spam) \1", "regex"),
+            _rule(2, r"(?P<word>scam) (?P=word)", "regex"),
+            _rule(3, r"(x)(y)", "regex"),
+        ]
+        matcher = HeuristicMatcher(rules)
+
+        assert matcher.match("spam spam") == 0
+        assert matcher.match("scam scam") == 1
+        assert matcher.match("xy") == 2
+        assert matcher.match("spam scam") is None
+
+    def test_hyperscan_contains_matches_substring_checks(self):
+        """With Hyperscan installed, contains rules should resolve exactly as substring checks."""
+        pytest.importorskip("hyperscan")
+        needles = ["free nitro", "nitro", "gift card", "ünïcode", "👋 hi"]
+        matcher = HeuristicMatcher(
+            [_rule(i, needle, "contains") for i, needle in enumerate(needles)]
+        )
+        messages = [
+            "FREE NITRO giveaway",
+            "nitro boost",
+            "Gift Card inside",
+            "ÜNÏCODE text",
+            "wave 👋 hi",
+            "nothing here",
+            "",
+        ]
+
+        assert matcher._hyperscan is not None
+        for message in messages:
+            expected = next(
+                (i for i, needle in enumerate(needles) if needle in message.lower()), None
+            )
+            assert matcher.match(message) == expected, message
+
+    def test_escaped_uppercase_regexes_still_match(self):
+        """Uppercase written as escapes or ranges should still match case-insensitively."""
+        patterns = [r"\x46ree nitro", r"[\x41-\x5a]ree nitro", r"[@-\[]ree nitro", r"[^\x46]ree"]
+
+        for pattern in patterns:
+            matcher = HeuristicMatcher([_rule(1, pattern, "regex")])
+            expected = 0 if re.search(pattern, "free nitro", re.IGNORECASE) else None
+            assert matcher.match("FREE NITRO") == expected, pattern
+            assert matcher.match("free nitro") == expected, pattern
+
+    def test_matcher_is_reused_for_identical_rules(self):
+        """Identical rule sets should share one compiled matcher."""
+        rules = [_rule(1, "spam", "contains")]
+
+        assert get_matcher(rules) is get_matcher([dict(rule) for rule in rules])
+        assert get_matcher(rules) is not get_matcher([_rule(2, "spam", "contains")])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -4,6 +4,12 @@ import pytest
 
 from sentinel.utils.discord import DISCORD_MAX_MESSAGE_LENGTH, split_message
 
+# Large inputs are built once at import instead of inside each test body
+WORDS_MESSAGE = "word " * 500  # ~2500 chars, words but no sentences
+LONG_ASCII_MESSAGE = "a" * 5000  # 5000 chars, needs 3 chunks
+EMOJI_MESSAGE = "Hello 👋 " * 300  # ~2400 chars with emoji
+EMOJI_COUNT = EMOJI_MESSAGE.count("👋")
+
 
 class TestMessageSplitting:
     """Test suite for the message splitting utility."""
@@ -69,9 +75,7 @@ class TestMessageSplitting:
     def test_split_at_word_boundary(self):
         """Should split at word boundaries when no sentence breaks."""
         # Create long text with words but no sentences
-        message = "word " * 500  # ~2500 chars, forces split
-
-        result = split_message(message)
+        result = split_message(WORDS_MESSAGE)
 
         assert len(result) >= 2
         assert all(len(chunk) <= DISCORD_MAX_MESSAGE_LENGTH for chunk in result)
@@ -83,15 +87,13 @@ class TestMessageSplitting:
 
     def test_very_long_message_multiple_splits(self):
         """Very long messages should split into multiple chunks."""
-        message = "a" * 5000  # 5000 chars, needs 3 chunks
-
-        result = split_message(message)
+        result = split_message(LONG_ASCII_MESSAGE)
 
         assert len(result) == 3
         assert all(len(chunk) <= DISCORD_MAX_MESSAGE_LENGTH for chunk in result)
 
         # Verify all content is preserved
-        assert "".join(result) == message
+        assert "".join(result) == LONG_ASCII_MESSAGE
 
     def test_content_preservation(self):
         """All original content should be preserved after splitting."""
@@ -109,16 +111,14 @@ class TestMessageSplitting:
 
     def test_unicode_characters(self):
         """Should handle unicode characters correctly."""
-        message = "Hello 👋 " * 300  # ~3000 chars with emoji
-
-        result = split_message(message)
+        result = split_message(EMOJI_MESSAGE)
 
         assert len(result) >= 2
         assert all(len(chunk) <= DISCORD_MAX_MESSAGE_LENGTH for chunk in result)
 
         # Verify emojis are preserved
         reconstructed = "".join(result)
-        assert reconstructed.count("👋") == message.count("👋")
+        assert reconstructed.count("👋") == EMOJI_COUNT
 
     def test_mixed_content_with_newlines_and_sentences(self):
         """Should handle mixed content with both paragraphs and sentences."""
@@ -177,7 +177,7 @@ class TestMessageSplitting:
 
     def test_whitespace_normalization(self):
         """Leading/trailing whitespace should be handled correctly."""
-        message = "   " + ("word " * 500) + "   "
+        message = "   " + WORDS_MESSAGE + "   "
 
         result = split_message(message)
 
@@ -0,0 +1,170 @@
+"""Tests for the state store's per-guild memory cache."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from sentinel.services import state as state_module
+from sentinel.services.state import MEMORY_CACHE_TTL, StateStore
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+class FakeDatabase:
+    """In-memory stand-in for the memory and guild-state queries of Database."""
+
+    is_connected = True
+
+    def __init__(self):
+        self.rows = []
+        self.fetches = []
+        # created_at values handed to the next add_memory calls, in order
+        self.upcoming_created_at = []
+        self._next_id = 1
+
+    def insert(self, guild_id, content, created_at=None):
+        row = {
+            "memory_id": self._next_id,
+            "guild_id": guild_id,
+            "author_id": 7,
+            "author_name": "admin",
+            "content": content,
+            "created_at": created_at or START + timedelta(minutes=self._next_id),
+        }
+        self._next_id += 1
+        self.rows.append(row)
+        return row
+
+    async def add_memory(self, guild_id, content, author, author_id):
+        created_at = self.upcoming_created_at.pop(0) if self.upcoming_created_at else None
+        return self.insert(guild_id, content, created_at)
+
+    async def fetch_memories(self, guild_id=None):
+        self.fetches.append(guild_id)
+        rows = [row for row in self.rows if guild_id is None or row["guild_id"] == guild_id]
+        # Like `order by created_at desc`; a created_at that isn't a datetime sorts as oldest,
+        # which is where the state store places timestamps it cannot parse
+        return sorted(rows, key=_created_instant, reverse=True)
+
+    async def delete_memory(self, guild_id, memory_id):
+        before = len(self.rows)
+        self.rows = [
+            row
+            for row in self.rows
+            if not (row["memory_id"] == memory_id and row["guild_id"] == guild_id)
+        ]
+        return len(self.rows) < before
+
+    async def get_llm_settings(self):
+        return {"api_key": "stored"}
+
+    async def fetch_guild_config(self, guild_id):
+        return None
+
+    async def fetch_persona(self, guild_id):
+        return None
+
+    async def fetch_context_channels(self, guild_id=None):
+        return []
+
+    async def fetch_automations(self):
+        return []
+
+
+def _created_instant(row):
+    created = row["created_at"]
+    return created if isinstance(created, datetime) else datetime.min.replace(tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the state module's monotonic clock with one the test advances by hand."""
+    now = [1000.0]
+    monkeypatch.setattr(state_module, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+def _contents(notes):
+    return [note.content for note in notes]
+
+
+class TestMemoryCache:
+    """Test suite for loading, expiring and updating cached guild memories."""
+
+    def test_loads_only_the_requested_guild(self, clock):
+        """A cache miss should fetch one guild's memories, not the whole table."""
+        db = FakeDatabase()
+        db.insert(1, "first guild")
+        db.insert(2, "second guild")
+        store = StateStore(database=db)
+
+        assert _contents(asyncio.run(store.list_memories(1))) == ["first guild"]
+        assert db.fetches == [1]
+
+    def test_reloads_after_ttl(self, clock):
+        """Memories written elsewhere should appear once the guild's cache expires."""
+        db = FakeDatabase()
+        db.insert(1, "old")
+        store = StateStore(database=db)
+
+        async def scenario():
+            await store.list_memories(1)
+            db.insert(1, "from another instance")
+            cached = await store.list_memories(1)
+            clock[0] += MEMORY_CACHE_TTL
+            return cached, await store.list_memories(1)
+
+        cached, reloaded = asyncio.run(scenario())
+
+        assert _contents(cached) == ["old"]
+        assert _contents(reloaded) == ["from another instance", "old"]
+        assert db.fetches == [1, 1]
+
+    def test_add_and_remove_update_cache(self, clock):
+        """Local writes should show up without waiting for the TTL."""
+        db = FakeDatabase()
+        db.insert(1, "kept")
+        store = StateStore(database=db)
+
+        async def scenario():
+            await store.list_memories(1)
+            added = await store.add_memory(1, "added", "admin", 7)
+            after_add = await store.list_memories(1)
+            await store.remove_memory(1, added.memory_id)
+            return after_add, await store.list_memories(1)
+
+        after_add, after_remove = asyncio.run(scenario())
+
+        assert _contents(after_add) == ["added", "kept"]
+        assert _contents(after_remove) == ["kept"]
+        assert db.fetches == [1]
+
+    def test_added_notes_keep_database_order(self, clock):
+        """Notes placed into the cache should end up where a fresh load would put them.
+
+        The offsets are chosen so that comparing the ISO strings would misorder them.
+        """
+        db = FakeDatabase()
+        db.insert(1, "loaded", START)
+        db.upcoming_created_at = [
+            datetime(2025, 1, 1, 12, 0, tzinfo=timezone(timedelta(hours=5))),  # 07:00 UTC
+            datetime(2025, 1, 1, 8, 0, tzinfo=timezone.utc),
+            datetime(2025, 1, 1, 3, 30, tzinfo=timezone(timedelta(hours=-5))),  # 08:30 UTC
+            "not a timestamp",
+        ]
+
+        async def scenario():
+            store = StateStore(database=db)
+            await store.get_state(1)
+            for content in ("plus five", "utc", "minus five", "unparsable"):
+                await store.add_memory(1, content, "admin", 7)
+            cached = await store.get_state(1)
+            fresh = await StateStore(database=db).get_state(1)
+            return cached.memories, fresh.memories
+
+        cached, fresh = asyncio.run(scenario())
+
+        assert _contents(cached) == ["minus five", "utc", "plus five", "loaded", "unparsable"]
+        assert _contents(cached) == _contents(fresh)
@@ -0,0 +1,53 @@
+"""Tests for the state store's database writes."""
+
+import asyncio
+
+import pytest
+
+from sentinel.services.state import StateStore
+
+
+class FakeDatabase:
+    """Just enough of Database for the state store's write path."""
+
+    is_connected = True
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.applied = []
+
+    async def get_llm_settings(self):
+        return {"api_key": "stored"}
+
+    async def upsert_guild_config(self, guild_id, **fields):
+        await asyncio.sleep(0)
+        if self.fail:
+            raise RuntimeError("database unavailable")
+        self.applied.append((guild_id, fields))
+
+
+class TestStateWrites:
+    """Test suite for setter writes and failure reporting."""
+
+    def test_setter_waits_for_write(self):
+        """A setter should return only after its write has been applied."""
+
+        async def scenario():
+            db = FakeDatabase()
+            store = StateStore(database=db)
+            await store.load()
+            await store.set_dry_run(42, True)
+            return db.applied
+
+        assert asyncio.run(scenario()) == [(42, {"dry_run": True})]
+
+    def test_failed_write_reaches_caller(self):
+        """A failing database write should raise from the setter instead of being swallowed."""
+
+        async def scenario():
+            store = StateStore(database=FakeDatabase(fail=True))
+            await store.load()
+            await store.set_dry_run(42, True)
+
+        with pytest.raises(RuntimeError, match="database unavailable"):
+            asyncio.run(scenario())
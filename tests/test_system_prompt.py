@@ -0,0 +1,62 @@
+"""Tests for system prompt assembly and caching."""
+
+import pytest
+
+from sentinel.services.state import BotState, MemoryNote, PersonaProfile
+from sentinel.utils.prompts import build_system_prompt
+
+
+def _note(content: str) -> MemoryNote:
+    return MemoryNote(
+        memory_id=1,
+        guild_id=42,
+        content=content,
+        author="admin",
+        author_id=7,
+        created_at="2025-01-01T00:00:00+00:00",
+    )
+
+
+class TestSystemPromptCache:
+    """Test suite for content-keyed system prompt memoization."""
+
+    def test_identical_content_reuses_prompt(self):
+        """Separately built snapshots with the same content should share the cached prompt."""
+        first = build_system_prompt(BotState(memories=[_note("alpha")]))
+        second = build_system_prompt(BotState(memories=[_note("alpha")]))
+
+        assert first is second
+
+    def test_changed_memories_rebuild_prompt(self):
+        """A snapshot with different memories should not reuse the cached prompt."""
+        first = build_system_prompt(BotState(memories=[_note("alpha")]))
+        second = build_system_prompt(BotState(memories=[_note("beta")]))
+
+        assert "alpha" in first
+        assert "beta" in second
+
+    def test_changed_persona_rebuilds_prompt(self):
+        """Persona changes made elsewhere (e.g. another instance) should show up immediately."""
+        before = build_system_prompt(BotState(persona=PersonaProfile(name="Before")))
+        after = build_system_prompt(BotState(persona=PersonaProfile(name="After")))
+
+        assert "You are Before" in before
+        assert "You are After" in after
+
+    def test_prompt_is_byte_stable(self):
+        """Identical state should produce identical prompts, guard tags included."""
+        state = BotState(memories=[_note("alpha")])
+
+        assert build_system_prompt(state) == build_system_prompt(state)
+
+    def test_guild_id_filters_memories(self):
+        """Passing guild_id should leave other guilds' memories out of the prompt."""
+        other = _note("other guild").model_copy(update={"guild_id": 99})
+        prompt = build_system_prompt(BotState(memories=[_note("alpha"), other]), guild_id=42)
+
+        assert "alpha" in prompt
+        assert "other guild" not in prompt
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])